@@ -4,7 +4,9 @@
 # ------------------------------------
 import logging
 import re
-from typing import Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 import urllib3
 from azure.core.credentials import AccessToken
 from azure.identity import (
@@ -32,6 +34,8 @@ WWW_AUTHENTICATE_REGEX = re.compile(
     """,
     re.VERBOSE | re.IGNORECASE)
 WWW_AUTHENTICATE_HEADER_NAME = "WWW-Authenticate"
+# cached tokens expiring within this many seconds are refreshed in the background
+TOKEN_REFRESH_WINDOW_SECONDS = 300
 
 
 class _DefaultAzureCredential(_ChainedTokenCredential):
@@ -53,6 +57,8 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
        - arm_endpoint (defaults to the production url "https://management.azure.com/")
     3) Add custom TokenFileCredential as first method to attempt,
        which will look for a local access token.
+    4) Cache the acquired tokens, such that concurrent callers share a single
+       token request, and refresh them in the background shortly before they expire.
     """
     def __init__(
         self,
@@ -74,6 +80,13 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         self.subscription_id = subscription_id
         self.arm_endpoint = arm_endpoint
         self.client_id = client_id
+        # set when the tenant_id could not be discovered
+        # and the default tenant_id was applied instead
+        self.tenant_id_discovery_failed = False
+        # tokens by (scopes, tenant_id, enable_cae), guarded by _token_lock,
+        # which is held while a token is being requested
+        self._tokens: Dict[Tuple, AccessToken] = {}
+        self._token_lock = threading.Lock()
         # credentials will be created lazy on the first call to get_token
         super(_DefaultAzureCredential, self).__init__()
 
@@ -114,12 +127,63 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
             The exception has a `message` attribute listing each authentication
             attempt and its error message.
         """
+        key = (scopes, kwargs.get("tenant_id"), bool(kwargs.get("enable_cae")))
+        if kwargs.get("claims"):
+            # a claims challenge requires a new token,
+            # which replaces the revoked one in the cache
+            with self._token_lock:
+                token = self._request_token(*scopes, **kwargs)
+                self._tokens[key] = token
+                return token
+
+        token = self._tokens.get(key)
+        if token:
+            remaining_seconds = token.expires_on - time.time()
+            if remaining_seconds > TOKEN_REFRESH_WINDOW_SECONDS:
+                return token
+            if remaining_seconds > 0:
+                self._refresh_token_in_background(key, *scopes, **kwargs)
+                return token
+
+        with self._token_lock:
+            # another caller may have acquired the token while we waited
+            token = self._tokens.get(key)
+            if token and token.expires_on > time.time():
+                return token
+            token = self._request_token(*scopes, **kwargs)
+            self._tokens[key] = token
+            return token
+
+    def _request_token(self, *scopes: str, **kwargs) -> AccessToken:
         # lazy-initialize the credentials
         if self.credentials is None or len(self.credentials) == 0:
             self._initialize_credentials()
 
         return super(_DefaultAzureCredential, self).get_token(*scopes, **kwargs)
 
+    def _refresh_token_in_background(self, key: Tuple, *scopes: str, **kwargs):
+        """
+        Start refreshing the token in a background thread,
+        unless a token request is already in progress.
+        """
+        if not self._token_lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self._tokens[key] = self._request_token(*scopes, **kwargs)
+            # pylint: disable=broad-exception-caught
+            except Exception as ex:
+                # the token will be requested again once it expires
+                _LOGGER.info("Background token refresh failed: %s", ex)
+            finally:
+                self._token_lock.release()
+
+        try:
+            threading.Thread(target=refresh, daemon=True).start()
+        except RuntimeError:
+            self._token_lock.release()
+
     def _discover_tenant_id_(self, arm_endpoint:str, subscription_id:str):
         """
         If the tenant_id was not given, try to obtain it
@@ -148,6 +212,7 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         # pylint: disable=broad-exception-caught
         except Exception as ex:
             _LOGGER.error(ex)
+            self.tenant_id_discovery_failed = True
 
         # apply default values
         self.tenant_id = self.tenant_id or ConnectionConstants.MSA_TENANT_ID
@@ -6,12 +6,21 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 
-from copy import deepcopy
-from typing import Any, TYPE_CHECKING
+import os
+from copy import copy
+from http.cookiejar import DefaultCookiePolicy
+from functools import cached_property
+from threading import Lock
+from typing import Any, Optional, TYPE_CHECKING
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
 from azure.core import PipelineClient
 from azure.core.pipeline import policies
+from azure.core.pipeline.transport import RequestsTransport
 from azure.core.rest import HttpRequest, HttpResponse
+from azure.core.utils import case_insensitive_dict
 
 from . import models as _models
 from ._configuration import QuantumClientConfiguration
@@ -30,6 +39,75 @@ if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
 
 
+def _clone_request(request: HttpRequest) -> HttpRequest:
+    """Shallow clone of ``request`` for ``send_request``.
+
+    Only the url and the headers are rewritten by the pipeline, so the copy owns
+    its own headers and shares the (read-only) method and body with the original.
+    Swapping the url on the caller's request instead would still leave it with the
+    headers added by the policies, and would race if the request is sent concurrently.
+    """
+    request_copy = copy(request)
+    request_copy.headers = case_insensitive_dict(request.headers)
+    return request_copy
+
+
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 32
+# kwargs that configure the requests session itself; clients passing
+# any of them get their own transport instead of the shared session
+_SESSION_KWARGS = frozenset((
+    "session",
+    "session_owner",
+    "use_env_settings",
+    "connection_timeout",
+    "read_timeout",
+    "connection_verify",
+    "connection_cert",
+    "connection_data_block_size",
+))
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Session (and therefore connection pool) shared by all QuantumClient instances.
+
+    Mirrors the adapter configuration RequestsTransport applies to the sessions it owns,
+    with a larger pool so that concurrent clients can reuse established connections.
+    Cookies are rejected, since the session is shared by clients of different workspaces.
+    """
+    global _shared_session  # pylint: disable=global-statement
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+            )
+            for protocol in ("http://", "https://"):
+                session.mount(protocol, adapter)
+            _shared_session = session
+        return _shared_session
+
+
+def _reset_shared_session() -> None:
+    """Drop the shared session in a forked child process.
+
+    The pooled connections of the parent must not be used by the child. The lock is recreated as well,
+    since another thread may have held it at the time of the fork.
+    """
+    global _shared_session, _shared_session_lock  # pylint: disable=global-statement
+    _shared_session = None
+    _shared_session_lock = Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reset_shared_session)
+
+
 class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
     """Azure Quantum REST API client.
 
@@ -57,6 +135,18 @@ class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
     :type workspace_name: str
     :param credential: Credential needed for the client to connect to Azure. Required.
     :type credential: ~azure.core.credentials.TokenCredential
+    :keyword transport: The HTTP transport to use. Defaults to a transport over a connection pool
+     shared by all QuantumClient instances, which is not closed when the client is closed. If any
+     session or connection settings (such as ``use_env_settings`` or ``connection_verify``) are
+     passed, the client creates and owns its own transport instead. A forked child process starts
+     with a new shared pool, and clients created before the fork should not be used in the child.
+    :paramtype transport: ~azure.core.pipeline.transport.HttpTransport
+    :keyword minimal_policies: Use a reduced policy chain (headers, user agent, content decoding,
+     retry, authentication and HTTP logging) for throughput-critical callers such as polling loops.
+     Request ids, proxies, redirects, custom hooks, network tracing and distributed tracing are
+     skipped. Ignored if ``policies`` is given. Internal use only; ``Workspace`` does not forward
+     it. Default value is False.
+    :paramtype minimal_policies: bool
     :keyword api_version: Api Version. Default value is "2023-11-13-preview". Note that overriding
      this default value may result in unsupported behavior.
     :paramtype api_version: str
@@ -72,6 +162,7 @@ class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
         **kwargs: Any
     ) -> None:
         _endpoint = kwargs.pop("endpoint", f"https://{azure_region}.quantum.azure.com")
+        _minimal_policies = kwargs.pop("minimal_policies", False)
         self._config = QuantumClientConfiguration(
             azure_region=azure_region,
             subscription_id=subscription_id,
@@ -81,6 +172,15 @@ class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
             **kwargs
         )
         _policies = kwargs.pop("policies", None)
+        if _policies is None and _minimal_policies:
+            _policies = [
+                self._config.headers_policy,
+                self._config.user_agent_policy,
+                policies.ContentDecodePolicy(**kwargs),
+                self._config.retry_policy,
+                self._config.authentication_policy,
+                self._config.http_logging_policy,
+            ]
         if _policies is None:
             _policies = [
                 policies.RequestIdPolicy(**kwargs),
@@ -97,6 +197,9 @@ class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
                 policies.SensitiveHeaderCleanupPolicy(**kwargs) if self._config.redirect_policy else None,
                 self._config.http_logging_policy,
             ]
+        if kwargs.get("transport") is None and _SESSION_KWARGS.isdisjoint(kwargs):
+            # the transport does not own the shared session, so closing this client leaves it open
+            kwargs["transport"] = RequestsTransport(session=_get_shared_session(), session_owner=False, **kwargs)
         self._client: PipelineClient = PipelineClient(base_url=_endpoint, policies=_policies, **kwargs)
 
         client_models = {k: v for k, v in _models._models.__dict__.items() if isinstance(v, type)}
@@ -104,12 +207,35 @@ class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
         self._serialize = Serializer(client_models)
         self._deserialize = Deserializer(client_models)
         self._serialize.client_side_validation = False
-        self.jobs = JobsOperations(self._client, self._config, self._serialize, self._deserialize)
-        self.providers = ProvidersOperations(self._client, self._config, self._serialize, self._deserialize)
-        self.storage = StorageOperations(self._client, self._config, self._serialize, self._deserialize)
-        self.quotas = QuotasOperations(self._client, self._config, self._serialize, self._deserialize)
-        self.sessions = SessionsOperations(self._client, self._config, self._serialize, self._deserialize)
-        self.top_level_items = TopLevelItemsOperations(self._client, self._config, self._serialize, self._deserialize)
+        # the azureRegion path argument never changes for the life of the client
+        self._azure_region_path_argument = self._serialize.url(
+            "self._config.azure_region", self._config.azure_region, "str", skip_quote=True
+        )
+
+    # operation groups are created on first access since most callers only use one or two of them
+    @cached_property
+    def jobs(self) -> JobsOperations:
+        return JobsOperations(self._client, self._config, self._serialize, self._deserialize)
+
+    @cached_property
+    def providers(self) -> ProvidersOperations:
+        return ProvidersOperations(self._client, self._config, self._serialize, self._deserialize)
+
+    @cached_property
+    def storage(self) -> StorageOperations:
+        return StorageOperations(self._client, self._config, self._serialize, self._deserialize)
+
+    @cached_property
+    def quotas(self) -> QuotasOperations:
+        return QuotasOperations(self._client, self._config, self._serialize, self._deserialize)
+
+    @cached_property
+    def sessions(self) -> SessionsOperations:
+        return SessionsOperations(self._client, self._config, self._serialize, self._deserialize)
+
+    @cached_property
+    def top_level_items(self) -> TopLevelItemsOperations:
+        return TopLevelItemsOperations(self._client, self._config, self._serialize, self._deserialize)
 
     def send_request(self, request: HttpRequest, *, stream: bool = False, **kwargs: Any) -> HttpResponse:
         """Runs the network request through the client's chained policies.
@@ -129,14 +255,10 @@ class QuantumClient:  # pylint: disable=client-accepts-api-version-keyword
         :rtype: ~azure.core.rest.HttpResponse
         """
 
-        request_copy = deepcopy(request)
-        path_format_arguments = {
-            "azureRegion": self._serialize.url(
-                "self._config.azure_region", self._config.azure_region, "str", skip_quote=True
-            ),
-        }
-
-        request_copy.url = self._client.format_url(request_copy.url, **path_format_arguments)
+        request_copy = _clone_request(request)
+        request_copy.url = self._client.format_url(
+            request_copy.url, azureRegion=self._azure_region_path_argument
+        )
         return self._client.send_request(request_copy, stream=stream, **kwargs)  # type: ignore
 
     def close(self) -> None:
@@ -5,13 +5,18 @@
 from __future__ import annotations
 import re
 import os
+from functools import lru_cache
 from re import Match
+from threading import Lock
 from typing import (
     Optional,
     Callable,
+    Dict,
+    Tuple,
     Union,
     Any
 )
+from azure.identity._constants import EnvironmentVariables as SdkEnvironmentVariables
 from azure.quantum._authentication import _DefaultAzureCredential
 from azure.quantum._constants import (
     EnvironmentKind,
@@ -20,22 +25,98 @@ from azure.quantum._constants import (
     GUID_REGEX_PATTERN,
 )
 
+_RESOURCE_ID_REGEX = re.compile(
+    fr"^/subscriptions/(?P<subscription_id>{GUID_REGEX_PATTERN})"
+    r"/resourceGroups/(?P<resource_group>[^\s/]+)"
+    r"/providers/Microsoft\.Quantum"
+    r"/Workspaces/(?P<workspace_name>[^\s/]+)$",
+    re.IGNORECASE)
+
+# EnvironmentKind members by name, used by the
+# `environment` setter to parse string values
+_ENVIRONMENT_KINDS = {kind.name: kind for kind in EnvironmentKind}
+
+# well-known endpoints by environment kind
+_QUANTUM_ENDPOINT_FACTORIES = {
+    EnvironmentKind.PRODUCTION: ConnectionConstants.GET_QUANTUM_PRODUCTION_ENDPOINT,
+    EnvironmentKind.CANARY: ConnectionConstants.GET_QUANTUM_CANARY_ENDPOINT,
+    EnvironmentKind.DOGFOOD: ConnectionConstants.GET_QUANTUM_DOGFOOD_ENDPOINT,
+}
+_ARM_ENDPOINTS = {
+    EnvironmentKind.PRODUCTION: ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+    EnvironmentKind.CANARY: ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+    EnvironmentKind.DOGFOOD: ConnectionConstants.ARM_DOGFOOD_ENDPOINT,
+}
+
+# environment variables read by the credentials chained by
+# _DefaultAzureCredential, whose values are part of its cache key
+_DEFAULT_CREDENTIAL_ENVIRONMENT_VARIABLES = tuple(dict.fromkeys(
+    SdkEnvironmentVariables.CLIENT_SECRET_VARS
+    + SdkEnvironmentVariables.CERT_VARS
+    + SdkEnvironmentVariables.USERNAME_PASSWORD_VARS
+    + (EnvironmentVariables.QUANTUM_TOKEN_FILE,)
+))
+_DEFAULT_CREDENTIALS_MAXSIZE = 32
+_default_credentials: Dict[Tuple, _DefaultAzureCredential] = {}
+_default_credentials_lock = Lock()
+
+
 class WorkspaceConnectionParams:
     """
     Internal Azure Quantum Python SDK class to handle logic
     for the parameters needed to connect to a Workspace.
     """
 
-    RESOURCE_ID_REGEX = re.compile(
-        fr"""
-            ^
-            /subscriptions/(?P<subscription_id>{GUID_REGEX_PATTERN})
-            /resourceGroups/(?P<resource_group>[^\s/]+)
-            /providers/Microsoft\.Quantum
-            /Workspaces/(?P<workspace_name>[^\s/]+)
-            $
-        """,
-        re.VERBOSE | re.IGNORECASE)
+    RESOURCE_ID_REGEX = _RESOURCE_ID_REGEX
+
+    __slots__ = (
+        "_location",
+        "_environment",
+        "_quantum_endpoint",
+        "_arm_endpoint",
+        "_resolved_quantum_endpoint",
+        "_resolved_arm_endpoint",
+        "subscription_id",
+        "resource_group",
+        "workspace_name",
+        "credential",
+        "user_agent",
+        "user_agent_app_id",
+        "client_id",
+        "tenant_id",
+        "api_version",
+        "on_new_client_request",
+    )
+    # fields printed by `__repr__`, leaving out the cached default endpoints
+    _REPR_FIELDS = tuple(
+        name for name in __slots__ if not name.startswith("_resolved_")
+    )
+
+    # fields set by `_merge`, in the order of its `new_values` tuple
+    _MERGE_FIELDS = (
+        "subscription_id",
+        "resource_group",
+        "workspace_name",
+        "location",
+        "credential",
+        "user_agent",
+        "user_agent_app_id",
+        "client_id",
+        "tenant_id",
+        "api_version",
+    )
+    # named groups that `_merge_re_match` reads from a regex match
+    _RE_MATCH_FIELDS = (
+        "subscription_id",
+        "resource_group",
+        "workspace_name",
+        "location",
+        "quantum_endpoint",
+        "arm_endpoint",
+    )
+    # (name, getter) of the properties printed by `__repr__`,
+    # populated once after the class definition
+    _PROPERTY_GETTERS = ()
 
     def __init__(
         self,
@@ -61,6 +142,10 @@ class WorkspaceConnectionParams:
         self._environment = None
         self._quantum_endpoint = None
         self._arm_endpoint = None
+        # default endpoints derived from the location and environment,
+        # cleared by the setters of the properties they depend on
+        self._resolved_quantum_endpoint = None
+        self._resolved_arm_endpoint = None
         # regular connection properties
         self.subscription_id = None
         self.resource_group = None
@@ -106,6 +191,7 @@ class WorkspaceConnectionParams:
         self._location = (value.replace(" ", "").lower()
                           if isinstance(value, str)
                           else value)
+        self._resolved_quantum_endpoint = None
 
     @property
     def environment(self):
@@ -117,9 +203,12 @@ class WorkspaceConnectionParams:
 
     @environment.setter
     def environment(self, value: Union[str, EnvironmentKind]):
-        self._environment = (EnvironmentKind[value.upper()]
-                             if isinstance(value, str)
-                             else value)
+        if isinstance(value, str):
+            value = (_ENVIRONMENT_KINDS.get(value)
+                     or _ENVIRONMENT_KINDS[value.upper()])
+        self._environment = value
+        self._resolved_quantum_endpoint = None
+        self._resolved_arm_endpoint = None
 
     @property
     def quantum_endpoint(self):
@@ -129,20 +218,22 @@ class WorkspaceConnectionParams:
         """
         if self._quantum_endpoint:
             return self._quantum_endpoint
-        if not self.location:
-            raise ValueError("Location not specified")
-        if self.environment is EnvironmentKind.PRODUCTION:
-            return ConnectionConstants.GET_QUANTUM_PRODUCTION_ENDPOINT(self.location)
-        if self.environment is EnvironmentKind.CANARY:
-            return ConnectionConstants.GET_QUANTUM_CANARY_ENDPOINT(self.location)
-        if self.environment is EnvironmentKind.DOGFOOD:
-            return ConnectionConstants.GET_QUANTUM_DOGFOOD_ENDPOINT(self.location)
-        raise ValueError(f"Unknown environment `{self.environment}`.")
+        if self._resolved_quantum_endpoint is None:
+            self._resolved_quantum_endpoint = self._get_default_quantum_endpoint()
+        return self._resolved_quantum_endpoint
 
     @quantum_endpoint.setter
     def quantum_endpoint(self, value: str):
         self._quantum_endpoint = value
 
+    def _get_default_quantum_endpoint(self) -> str:
+        if not self.location:
+            raise ValueError("Location not specified")
+        environment = self.environment
+        if environment not in _QUANTUM_ENDPOINT_FACTORIES:
+            raise ValueError(f"Unknown environment `{environment}`.")
+        return _QUANTUM_ENDPOINT_FACTORIES[environment](self.location)
+
     @property
     def arm_endpoint(self):
         """
@@ -151,29 +242,33 @@ class WorkspaceConnectionParams:
         """
         if self._arm_endpoint:
             return self._arm_endpoint
-        if self.environment is EnvironmentKind.DOGFOOD:
-            return ConnectionConstants.ARM_DOGFOOD_ENDPOINT
-        if self.environment in [EnvironmentKind.PRODUCTION,
-                                EnvironmentKind.CANARY]:
-            return ConnectionConstants.ARM_PRODUCTION_ENDPOINT
-        raise ValueError(f"Unknown environment `{self.environment}`.")
+        if self._resolved_arm_endpoint is None:
+            self._resolved_arm_endpoint = self._get_default_arm_endpoint()
+        return self._resolved_arm_endpoint
 
     @arm_endpoint.setter
     def arm_endpoint(self, value: str):
         self._arm_endpoint = value
 
+    def _get_default_arm_endpoint(self) -> str:
+        environment = self.environment
+        if environment not in _ARM_ENDPOINTS:
+            raise ValueError(f"Unknown environment `{environment}`.")
+        return _ARM_ENDPOINTS[environment]
+
     def __repr__(self):
         """
         Print all fields and properties.
         """
         info = []
-        for key in vars(self):
-            info.append(f"    {key}: {self.__dict__[key]}")
-        cls = type(self)
-        for key in dir(self):
-            attr = getattr(cls, key, None)
-            if attr and isinstance(attr, property) and attr.fget:
-                info.append(f"    {key}: {attr.fget(self)}")
+        for key in self._REPR_FIELDS:
+            info.append(f"    {key}: {getattr(self, key)}")
+        for key, fget in self._PROPERTY_GETTERS:
+            try:
+                value = fget(self)
+            except Exception as ex:  # pylint: disable=broad-except
+                value = f"<{type(ex).__name__}>"
+            info.append(f"    {key}: {value}")
         info.sort()
         info.insert(0, super().__repr__())
         return "\n".join(info)
@@ -184,9 +279,7 @@ class WorkspaceConnectionParams:
         parameters obtained from it.
         """
         if resource_id:
-            match = re.search(
-                WorkspaceConnectionParams.RESOURCE_ID_REGEX,
-                resource_id)
+            match = _parse_resource_id(resource_id)
             if not match:
                 raise ValueError("Invalid resource id")
             self._merge_re_match(match)
@@ -295,28 +388,32 @@ class WorkspaceConnectionParams:
         If merge_default_mode is True, skip setting
         the field/property if it already has a value.
         """
-        def _get_value_or_default(old_value, new_value):
-            if merge_default_mode and old_value:
-                return old_value
-            if new_value:
-                return new_value
-            return old_value
-
-        self.subscription_id = _get_value_or_default(self.subscription_id, subscription_id)
-        self.resource_group = _get_value_or_default(self.resource_group, resource_group)
-        self.workspace_name = _get_value_or_default(self.workspace_name, workspace_name)
-        self.location = _get_value_or_default(self.location, location)
-        self.environment = _get_value_or_default(self.environment, environment)
-        self.credential = _get_value_or_default(self.credential, credential)
-        self.user_agent = _get_value_or_default(self.user_agent, user_agent)
-        self.user_agent_app_id = _get_value_or_default(self.user_agent_app_id, user_agent_app_id)
-        self.client_id = _get_value_or_default(self.client_id, client_id)
-        self.tenant_id = _get_value_or_default(self.tenant_id, tenant_id)
-        self.api_version = _get_value_or_default(self.api_version, api_version)
+        new_values = (
+            subscription_id,
+            resource_group,
+            workspace_name,
+            location,
+            credential,
+            user_agent,
+            user_agent_app_id,
+            client_id,
+            tenant_id,
+            api_version,
+        )
+        for name, new_value in zip(self._MERGE_FIELDS, new_values):
+            if new_value and not (merge_default_mode and getattr(self, name)):
+                setattr(self, name, new_value)
+        # the environment getter returns a default value,
+        # which is kept as the old_value
+        self.environment = (environment
+                            if environment and not merge_default_mode
+                            else self.environment)
         # for these properties that have a default value in the getter, we use
         # the private field as the old_value
-        self.quantum_endpoint = _get_value_or_default(self._quantum_endpoint, quantum_endpoint)
-        self.arm_endpoint = _get_value_or_default(self._arm_endpoint, arm_endpoint)
+        if quantum_endpoint and not (merge_default_mode and self._quantum_endpoint):
+            self.quantum_endpoint = quantum_endpoint
+        if arm_endpoint and not (merge_default_mode and self._arm_endpoint):
+            self.arm_endpoint = arm_endpoint
         return self
 
     def _merge_connection_params(
@@ -352,10 +449,11 @@ class WorkspaceConnectionParams:
     def get_credential_or_default(self) -> Any:
         """
         Get the credential if one was set,
-        or defaults to a new _DefaultAzureCredential.
+        or defaults to a _DefaultAzureCredential shared by all
+        instances with the same connection parameters.
         """
         return (self.credential
-                or _DefaultAzureCredential(
+                or _get_default_credential(
                     subscription_id=self.subscription_id,
                     arm_endpoint=self.arm_endpoint,
                     tenant_id=self.tenant_id))
@@ -398,11 +496,12 @@ class WorkspaceConnectionParams:
         Returns true if we have all necessary parameters
         to connect to the Azure Quantum Workspace.
         """
-        return (self.location
-                and self.subscription_id
-                and self.resource_group
-                and self.workspace_name
-                and self.get_credential_or_default())
+        # a credential is always available since `get_credential_or_default`
+        # falls back to a _DefaultAzureCredential, so we don't create one here
+        return bool(self.location
+                    and self.subscription_id
+                    and self.resource_group
+                    and self.workspace_name)
 
     def assert_complete(self):
         """
@@ -424,27 +523,28 @@ class WorkspaceConnectionParams:
         Apply default values found in the environment variables
         if current parameters are not set.
         """
+        env = os.environ
         self.subscription_id = (self.subscription_id
-                                or os.environ.get(EnvironmentVariables.QUANTUM_SUBSCRIPTION_ID)
-                                or os.environ.get(EnvironmentVariables.SUBSCRIPTION_ID))
+                                or env.get(EnvironmentVariables.QUANTUM_SUBSCRIPTION_ID)
+                                or env.get(EnvironmentVariables.SUBSCRIPTION_ID))
         self.resource_group = (self.resource_group
-                               or os.environ.get(EnvironmentVariables.QUANTUM_RESOURCE_GROUP)
-                               or os.environ.get(EnvironmentVariables.RESOURCE_GROUP))
+                               or env.get(EnvironmentVariables.QUANTUM_RESOURCE_GROUP)
+                               or env.get(EnvironmentVariables.RESOURCE_GROUP))
         self.workspace_name = (self.workspace_name
-                               or os.environ.get(EnvironmentVariables.WORKSPACE_NAME))
+                               or env.get(EnvironmentVariables.WORKSPACE_NAME))
         self.location = (self.location
-                         or os.environ.get(EnvironmentVariables.QUANTUM_LOCATION)
-                         or os.environ.get(EnvironmentVariables.LOCATION))
+                         or env.get(EnvironmentVariables.QUANTUM_LOCATION)
+                         or env.get(EnvironmentVariables.LOCATION))
         self.user_agent_app_id = (self.user_agent_app_id
-                                  or os.environ.get(EnvironmentVariables.USER_AGENT_APPID))
+                                  or env.get(EnvironmentVariables.USER_AGENT_APPID))
         self.tenant_id = (self.tenant_id
-                          or os.environ.get(EnvironmentVariables.AZURE_TENANT_ID))
+                          or env.get(EnvironmentVariables.AZURE_TENANT_ID))
         self.client_id = (self.client_id
-                          or os.environ.get(EnvironmentVariables.AZURE_CLIENT_ID))
+                          or env.get(EnvironmentVariables.AZURE_CLIENT_ID))
         # for these properties we use the private field
         # because the getter return default values
         self.environment = (self._environment
-                            or os.environ.get(EnvironmentVariables.QUANTUM_ENV))
+                            or env.get(EnvironmentVariables.QUANTUM_ENV))
         return self
 
     @classmethod
@@ -458,13 +558,65 @@ class WorkspaceConnectionParams:
         return WorkspaceConnectionParams().default_from_env_vars()
 
     def _merge_re_match(self, re_match: Match[str]):
-        def get_value(group_name):
-            return re_match.groupdict().get(group_name)
-        self.merge(
-            subscription_id=get_value('subscription_id'),
-            resource_group=get_value('resource_group'),
-            workspace_name=get_value('workspace_name'),
-            location=get_value('location'),
-            quantum_endpoint=get_value('quantum_endpoint'),
-            arm_endpoint=get_value('arm_endpoint'),
-        )
+        """
+        Set the connection parameters captured by the
+        named groups of `re_match` that have a value.
+        """
+        groups = re_match.groupdict()
+        # the values are freshly parsed, so they are assigned
+        # directly instead of going through `merge`
+        for name in self._RE_MATCH_FIELDS:
+            value = groups.get(name)
+            if value:
+                setattr(self, name, value)
+
+
+WorkspaceConnectionParams._PROPERTY_GETTERS = tuple(
+    (name, attr.fget) for name, attr in vars(WorkspaceConnectionParams).items()
+    if isinstance(attr, property) and attr.fget
+)
+
+
+@lru_cache(maxsize=32)
+def _parse_resource_id(resource_id: str) -> Optional[Match[str]]:
+    """
+    Match the resource_id against the RESOURCE_ID_REGEX.
+    Results are cached since the same resource_id is
+    typically used to construct many Workspace instances.
+    """
+    return _RESOURCE_ID_REGEX.match(resource_id)
+
+
+def _get_default_credential(
+    subscription_id: str,
+    arm_endpoint: str,
+    tenant_id: Optional[str],
+) -> _DefaultAzureCredential:
+    """
+    Get a _DefaultAzureCredential for the given parameters.
+    Instances are cached so that the credential chain and the
+    tokens it acquires are reused across Workspace instances,
+    unless the environment variables read by the credential chain
+    changed or it failed to discover the tenant_id.
+    """
+    key = (
+        subscription_id,
+        arm_endpoint,
+        tenant_id,
+        tuple(os.environ.get(name)
+              for name in _DEFAULT_CREDENTIAL_ENVIRONMENT_VARIABLES),
+    )
+    with _default_credentials_lock:
+        credential = _default_credentials.pop(key, None)
+        # a credential that fell back to the default tenant_id
+        # is replaced, so that the discovery is retried
+        if credential is None or credential.tenant_id_discovery_failed:
+            credential = _DefaultAzureCredential(
+                subscription_id=subscription_id,
+                arm_endpoint=arm_endpoint,
+                tenant_id=tenant_id)
+        # re-insert the key to keep the least recently used one first
+        _default_credentials[key] = credential
+        if len(_default_credentials) > _DEFAULT_CREDENTIALS_MAXSIZE:
+            del _default_credentials[next(iter(_default_credentials))]
+    return credential
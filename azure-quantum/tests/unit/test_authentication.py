@@ -4,11 +4,13 @@
 ##
 from pathlib import Path
 from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import time
 import pytest
 from common import QuantumTestBase
+from azure.core.credentials import AccessToken
 from azure.identity import (
     CredentialUnavailableError,
     ClientSecretCredential,
@@ -109,6 +111,95 @@ class TestWorkspace(QuantumTestBase):
         self.assertEqual(token.token, "fake_token")
         self.assertEqual(token.expires_on, pytest.approx(one_hour_ahead))
 
+    def test_default_credential_shares_token_requests(self):
+        credential = _DefaultAzureCredential(
+            arm_endpoint=ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+            subscription_id=self.connection_params.subscription_id,
+            tenant_id=self.connection_params.tenant_id)
+        token = AccessToken("token", int(time.time()) + 3600)
+
+        def request_token(*scopes, **kwargs):
+            time.sleep(0.1)
+            return token
+
+        with patch.object(credential, "_request_token",
+                          side_effect=request_token) as mock_request_token:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(credential.get_token,
+                                    ConnectionConstants.DATA_PLANE_CREDENTIAL_SCOPE)
+                    for _ in range(4)
+                ]
+                results = [future.result() for future in futures]
+            self.assertEqual(results, [token] * 4)
+            self.assertEqual(mock_request_token.call_count, 1)
+
+    def test_default_credential_refreshes_expiring_token_in_background(self):
+        credential = _DefaultAzureCredential(
+            arm_endpoint=ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+            subscription_id=self.connection_params.subscription_id,
+            tenant_id=self.connection_params.tenant_id)
+        scope = ConnectionConstants.DATA_PLANE_CREDENTIAL_SCOPE
+        expiring_token = AccessToken("expiring", int(time.time()) + 60)
+        new_token = AccessToken("new", int(time.time()) + 3600)
+
+        with patch.object(credential, "_request_token",
+                          side_effect=[expiring_token, new_token]):
+            self.assertEqual(credential.get_token(scope), expiring_token)
+            # the expiring token is still returned while it is refreshed
+            self.assertEqual(credential.get_token(scope), expiring_token)
+            for _ in range(50):
+                if credential.get_token(scope) == new_token:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(credential.get_token(scope), new_token)
+
+    def test_default_credential_caches_tokens_per_cae_mode(self):
+        credential = _DefaultAzureCredential(
+            arm_endpoint=ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+            subscription_id=self.connection_params.subscription_id,
+            tenant_id=self.connection_params.tenant_id)
+        scope = ConnectionConstants.DATA_PLANE_CREDENTIAL_SCOPE
+        token = AccessToken("token", int(time.time()) + 3600)
+        cae_token = AccessToken("cae_token", int(time.time()) + 3600)
+
+        with patch.object(credential, "_request_token",
+                          side_effect=[token, cae_token]):
+            self.assertEqual(credential.get_token(scope), token)
+            self.assertEqual(credential.get_token(scope, enable_cae=True), cae_token)
+            self.assertEqual(credential.get_token(scope), token)
+            self.assertEqual(credential.get_token(scope, enable_cae=True), cae_token)
+
+    def test_default_credential_replaces_token_after_claims_challenge(self):
+        credential = _DefaultAzureCredential(
+            arm_endpoint=ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+            subscription_id=self.connection_params.subscription_id,
+            tenant_id=self.connection_params.tenant_id)
+        scope = ConnectionConstants.DATA_PLANE_CREDENTIAL_SCOPE
+        revoked_token = AccessToken("revoked", int(time.time()) + 3600)
+        new_token = AccessToken("new", int(time.time()) + 3600)
+
+        with patch.object(credential, "_request_token",
+                          side_effect=[revoked_token, new_token]) as mock_request_token:
+            self.assertEqual(credential.get_token(scope, enable_cae=True), revoked_token)
+            self.assertEqual(
+                credential.get_token(scope, enable_cae=True, claims="challenge"),
+                new_token)
+            self.assertEqual(credential.get_token(scope, enable_cae=True), new_token)
+            self.assertEqual(mock_request_token.call_count, 2)
+
+    def test_default_credential_tenant_id_discovery_failed(self):
+        credential = _DefaultAzureCredential(
+            arm_endpoint=ConnectionConstants.ARM_PRODUCTION_ENDPOINT,
+            subscription_id=self.connection_params.subscription_id)
+
+        with patch("urllib3.PoolManager.request", side_effect=OSError("unreachable")):
+            credential._discover_tenant_id_(
+                arm_endpoint=credential.arm_endpoint,
+                subscription_id=credential.subscription_id)
+        self.assertTrue(credential.tenant_id_discovery_failed)
+        self.assertEqual(credential.tenant_id, ConnectionConstants.MSA_TENANT_ID)
+
     @pytest.mark.live_test
     def test_workspace_auth_token_credential(self):
         with patch.dict(os.environ):
@@ -14,7 +14,16 @@ from common import (
     STORAGE,
     API_KEY,
 )
+from azure.core.pipeline.policies import ContentDecodePolicy, HeadersPolicy
+from azure.core.pipeline.transport import HttpTransport
+from azure.core.rest import HttpRequest
 from azure.quantum import Workspace
+from azure.quantum._client import QuantumClient
+from azure.quantum._client._client import _reset_shared_session
+from azure.quantum._workspace_connection_params import (
+    WorkspaceConnectionParams,
+    _parse_resource_id,
+)
 from azure.quantum._constants import (
     EnvironmentVariables,
     ConnectionConstants,
@@ -65,6 +74,42 @@ class TestWorkspace(QuantumTestBase):
         )
         self.assertEqual(ws.storage, STORAGE)
 
+    def test_create_workspace_resource_id_parsed_once(self):
+        _parse_resource_id.cache_clear()
+        for _ in range(3):
+            ws = Workspace(
+                resource_id=SIMPLE_RESOURCE_ID,
+                location=LOCATION,
+            )
+            self.assertEqual(ws.subscription_id, SUBSCRIPTION_ID)
+            self.assertEqual(ws.resource_group, RESOURCE_GROUP)
+            self.assertEqual(ws.name, WORKSPACE)
+        cache_info = _parse_resource_id.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 2)
+
+    def test_create_workspace_default_credential_shared(self):
+        def default_credential(**kwargs):
+            ws = Workspace(
+                resource_id=SIMPLE_RESOURCE_ID,
+                location=LOCATION,
+                **kwargs,
+            )
+            return ws._connection_params.get_credential_or_default()
+
+        credential = default_credential()
+        self.assertIs(default_credential(), credential)
+        self.assertIsNot(default_credential(tenant_id="other-tenant"), credential)
+
+        with mock.patch.dict(os.environ, {EnvironmentVariables.AZURE_CLIENT_ID: "other-client"}):
+            self.assertIsNot(default_credential(), credential)
+
+        # a credential that failed to discover the tenant_id is not reused
+        credential.tenant_id_discovery_failed = True
+        new_credential = default_credential()
+        self.assertIsNot(new_credential, credential)
+        self.assertIs(default_credential(), new_credential)
+
     def test_create_workspace_locations(self):
         # User-provided location name should be normalized
         location = "East US"
@@ -221,6 +266,155 @@ class TestWorkspace(QuantumTestBase):
         jobs = ws.list_jobs()
         self.assertIsInstance(jobs, list)
 
+    def test_workspace_default_endpoints_follow_location_and_environment(self):
+        connection_params = WorkspaceConnectionParams(location="eastus")
+        self.assertEqual(connection_params.quantum_endpoint,
+                         "https://eastus.quantum.azure.com/")
+        self.assertEqual(connection_params.arm_endpoint,
+                         ConnectionConstants.ARM_PRODUCTION_ENDPOINT)
+
+        connection_params.location = "West US"
+        self.assertEqual(connection_params.quantum_endpoint,
+                         "https://westus.quantum.azure.com/")
+
+        connection_params.environment = "dogfood"
+        self.assertEqual(connection_params.quantum_endpoint,
+                         "https://westus.quantum-test.azure.com/")
+        self.assertEqual(connection_params.arm_endpoint,
+                         ConnectionConstants.ARM_DOGFOOD_ENDPOINT)
+
+        connection_params.quantum_endpoint = "https://custom.endpoint/"
+        self.assertEqual(connection_params.quantum_endpoint,
+                         "https://custom.endpoint/")
+
+        # the cached default endpoints are not printed
+        info = repr(connection_params)
+        self.assertIn("quantum_endpoint: https://custom.endpoint/", info)
+        self.assertNotIn("_resolved_", info)
+
+    def test_workspace_client_send_request_does_not_modify_request(self):
+        transport = mock.MagicMock(spec=HttpTransport)
+        client = QuantumClient(
+            azure_region=LOCATION,
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group_name=RESOURCE_GROUP,
+            workspace_name=WORKSPACE,
+            credential=mock.Mock(),
+            transport=transport,
+            policies=[HeadersPolicy({"x-test": "value"})],
+        )
+        request = HttpRequest("GET", "https://{azureRegion}.quantum.azure.com/v1/jobs")
+        client.send_request(request)
+
+        sent_request = transport.send.call_args[0][0]
+        self.assertEqual(sent_request.url,
+                         f"https://{LOCATION}.quantum.azure.com/v1/jobs")
+        self.assertEqual(sent_request.headers["x-test"], "value")
+        self.assertEqual(request.url,
+                         "https://{azureRegion}.quantum.azure.com/v1/jobs")
+        self.assertNotIn("x-test", request.headers)
+
+        client.send_request(HttpRequest("GET", "/v1/jobs?next=https://x/y"))
+        sent_request = transport.send.call_args[0][0]
+        self.assertEqual(sent_request.url,
+                         f"https://{LOCATION}.quantum.azure.com/v1/jobs?next=https://x/y")
+
+    def test_workspace_client_send_request_with_templated_endpoint(self):
+        transport = mock.MagicMock(spec=HttpTransport)
+        client = QuantumClient(
+            azure_region=LOCATION,
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group_name=RESOURCE_GROUP,
+            workspace_name=WORKSPACE,
+            credential=mock.Mock(),
+            endpoint="https://{azureRegion}.quantum.azure.com",
+            transport=transport,
+            policies=[HeadersPolicy()],
+        )
+        client.send_request(HttpRequest("GET", "/v1/jobs"))
+        sent_request = transport.send.call_args[0][0]
+        self.assertEqual(sent_request.url,
+                         f"https://{LOCATION}.quantum.azure.com/v1/jobs")
+
+    def test_workspace_client_shares_http_session(self):
+        def create_client(**kwargs):
+            return QuantumClient(
+                azure_region=LOCATION,
+                subscription_id=SUBSCRIPTION_ID,
+                resource_group_name=RESOURCE_GROUP,
+                workspace_name=WORKSPACE,
+                credential=mock.Mock(),
+                **kwargs,
+            )
+
+        client1 = create_client()
+        client2 = create_client()
+        session = client1._client._pipeline._transport.session
+        self.assertIs(client2._client._pipeline._transport.session, session)
+        self.assertEqual(session.cookies.get_policy().allowed_domains(), ())
+
+        # closing a client leaves the shared session open
+        client1.close()
+        self.assertIs(client2._client._pipeline._transport.session, session)
+        self.assertTrue(session.adapters)
+
+        # session settings get a transport owned by the client
+        client3 = create_client(use_env_settings=False)
+        with client3:
+            transport = client3._client._pipeline._transport
+            self.assertIsNot(transport.session, session)
+            self.assertFalse(transport.session.trust_env)
+
+        # a forked child process gets a new shared session
+        _reset_shared_session()
+        client4 = create_client()
+        session4 = client4._client._pipeline._transport.session
+        self.assertIsNot(session4, session)
+        self.assertIs(create_client()._client._pipeline._transport.session, session4)
+
+    def test_workspace_client_minimal_policies(self):
+        transport = mock.MagicMock(spec=HttpTransport)
+        transport.send.return_value = mock.MagicMock(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            content_type="application/json")
+        transport.send.return_value.text.return_value = "{}"
+        client = QuantumClient(
+            azure_region=LOCATION,
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group_name=RESOURCE_GROUP,
+            workspace_name=WORKSPACE,
+            credential=mock.Mock(),
+            transport=transport,
+            minimal_policies=True,
+        )
+        config = client._config
+        expected_policies = [
+            config.headers_policy,
+            config.user_agent_policy,
+            ContentDecodePolicy,
+            config.retry_policy,
+            config.authentication_policy,
+            config.http_logging_policy,
+        ]
+        pipeline_policies = [
+            getattr(policy, "_policy", policy)
+            for policy in client._client._pipeline._impl_policies
+        ]
+        self.assertEqual(len(pipeline_policies), len(expected_policies))
+        for policy, expected in zip(pipeline_policies, expected_policies):
+            if isinstance(expected, type):
+                self.assertIsInstance(policy, expected)
+            else:
+                self.assertIs(policy, expected)
+
+        client.send_request(HttpRequest("GET", "/v1/jobs"))
+        sent_request = transport.send.call_args[0][0]
+        self.assertEqual(sent_request.url,
+                         f"https://{LOCATION}.quantum.azure.com/v1/jobs")
+        self.assertIn("Authorization", sent_request.headers)
+        self.assertNotIn("x-ms-client-request-id", sent_request.headers)
+
     def test_workspace_user_agent_appid(self):
         app_id = "MyEnvVarAppId"
         user_agent = "MyUserAgent"